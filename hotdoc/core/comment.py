@@ -21,7 +21,8 @@ This module implements a Comment class, to be used
 by code-parsing extensions.
 """
 import os
-from collections import defaultdict
+
+from hotdoc.utils.utils import nested_defaultdict
 
 
 # pylint: disable=too-few-public-methods
@@ -104,7 +105,7 @@ class Comment:
         else:
             self.short_description = ''
 
-        self.extension_attrs = defaultdict(lambda: defaultdict(dict))
+        self.extension_attrs = nested_defaultdict()
         self.tags = tags or {}
         self.meta = meta or {}
         self.raw_comment = raw_comment
@@ -118,15 +119,16 @@ class Comment:
         return cleaned_meta
 
     def __getstate__(self):
-        # Return a copy
+        # Return a copy, without the extension attributes: these are
+        # restored empty by __setstate__ anyway
         res = dict(self.__dict__)
-        res['extension_attrs'] = None
+        del res['extension_attrs']
         return res
 
     # pylint: disable=attribute-defined-outside-init
     def __setstate__(self, state):
         self.__dict__ = state
-        self.extension_attrs = defaultdict(lambda: defaultdict(dict))
+        self.extension_attrs = nested_defaultdict()
 
 
 class Annotation:
@@ -25,9 +25,14 @@ import glob
 
 from hotdoc.utils.utils import OrderedSet
 from hotdoc.utils.utils import flatten_list
+from hotdoc.utils.utils import write_if_changed
 from hotdoc.utils.loggable import error
 
 
+# Command line arguments that only make sense for the current invocation
+_UNDUMPED_CLI_KEYS = frozenset(('command', 'output_conf_file'))
+
+
 def load_config_json(conf_file):
     """Banana?"""
     try:
@@ -398,8 +403,8 @@ class Config:
                         relpath = os.path.relpath(path, conf_dir)
                         new_list.append(relpath)
                 final_conf[key] = new_list
-            elif key not in ['command', 'output_conf_file']:
+            elif key not in _UNDUMPED_CLI_KEYS:
                 final_conf[key] = value
 
-        with open(conf_file or self.conf_file or 'hotdoc.json', 'w') as _:
-            _.write(json.dumps(final_conf, sort_keys=True, indent=4))
+        write_if_changed(conf_file or self.conf_file or 'hotdoc.json',
+                         json.dumps(final_conf, sort_keys=True, indent=4))
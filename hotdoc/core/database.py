@@ -20,14 +20,16 @@
 """
 import os
 import json
+import functools
 
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 
 # pylint: disable=import-error
 # pylint: disable=import-error
 from hotdoc.core.exceptions import HotdocException
 from hotdoc.core.symbols import Symbol, ProxySymbol
 from hotdoc.utils.signals import Signal
+from hotdoc.utils.utils import write_atomically
 from hotdoc.utils.loggable import debug, warn, Logger
 
 
@@ -44,6 +46,24 @@ Logger.register_warning_code(
 # pylint: disable=too-few-public-methods
 
 
+@functools.lru_cache(maxsize=4096)
+def _normpath(filename):
+    return os.path.normpath(filename)
+
+
+def _abspath(filename):
+    # Extensions create many symbols from the same handful of absolute
+    # paths, and normalizing those does not depend on the working directory
+    if os.path.isabs(filename):
+        return _normpath(filename)
+    return os.path.abspath(filename)
+
+
+# These files are meant for tools, not humans: skip indentation and
+# whitespace, which made up a large part of their size
+JSON_SEPARATORS = (',', ':')
+
+
 def serialize(obj):
     try:
         return obj.__getstate__()
@@ -64,10 +84,10 @@ class Database:
     def __init__(self, private_folder):
         self.comment_added_signal = Signal()
 
-        self.__comments = OrderedDict()
-        self.__symbols = OrderedDict()
+        self.__comments = {}
+        self.__symbols = {}
         self.__aliased = defaultdict(list)
-        self.__aliases = OrderedDict()
+        self.__aliases = {}
         self.__private_folder = private_folder or '/tmp'
 
     def add_comment(self, comment):
@@ -111,8 +131,8 @@ class Database:
 
         filename = kwargs.get('filename')
         if filename:
-            filename = os.path.abspath(filename)
-            kwargs['filename'] = os.path.abspath(filename)
+            filename = _abspath(filename)
+            kwargs['filename'] = filename
 
         if unique_name in self.__symbols and not type_ == ProxySymbol:
             warn('symbol-redefined', "%s(unique_name=%s, filename=%s, project=%s)"
@@ -133,16 +153,20 @@ class Database:
         debug('Created symbol with unique name %s' % unique_name,
               'symbols')
 
-        for key, value in list(kwargs.items()):
+        for key, value in kwargs.items():
             setattr(symbol, key, value)
         symbol.aliases += alias_symbols
 
         if not isinstance(symbol, ProxySymbol):
             self.__symbols[unique_name] = symbol
-        self.__aliased[unique_name].extend(aliases)
 
-        for alias in self.__aliased[unique_name]:
-            self.__aliases[alias] = symbol
+        if aliases:
+            self.__aliased[unique_name].extend(aliases)
+
+        # Most symbols have no aliases, avoid creating empty entries for them
+        aliased = self.__aliased.get(unique_name)
+        if aliased:
+            self.__aliases.update(dict.fromkeys(aliased, symbol))
 
         return symbol
 
@@ -160,48 +184,68 @@ class Database:
                   (target, unique_name))
         return sym
 
-    @staticmethod
-    def __get_pickle_path(folder, name, create_if_required=False):
-        fname = os.path.join(folder, name.lstrip('/'))
-        if create_if_required:
-            os.makedirs(os.path.dirname(fname), exist_ok=True)
-        return fname
-
     def persist(self):
         """
         Banana banana
         """
         # Let's try and use the name of the symbols comments ended up
         # associated with as the keys
-        resolved_comments = OrderedDict()
+        resolved_comments = {}
 
-        for name, comment in self.__comments.items():
+        comments = self.__comments
+        for (name, comment), sym in zip(comments.items(),
+                                        self.get_symbols(comments)):
             if comment:
-                sym = self.get_symbol(name)
                 if sym:
                     resolved_comments[sym.unique_name] = comment
                 else:
                     resolved_comments[name] = comment
 
-        with open(os.path.join(self.__private_folder, 'all_comments.json'), 'w', encoding='utf8') as f:
-            f.write(json.dumps(resolved_comments, default=serialize, indent=2))
+        write_atomically(
+            os.path.join(self.__private_folder, 'all_comments.json'),
+            json.dumps(resolved_comments, default=serialize,
+                       separators=JSON_SEPARATORS))
 
-        with open(os.path.join(self.__private_folder, 'symbol_index.json'), 'w', encoding='utf8') as f:
-            f.write(json.dumps(list(self.get_all_symbols().keys()),
-                    default=serialize, indent=2))
+        write_atomically(
+            os.path.join(self.__private_folder, 'symbol_index.json'),
+            json.dumps(list(self.get_all_symbols().keys()),
+                       default=serialize, separators=JSON_SEPARATORS))
 
     def __get_aliases(self, name):
-        return self.__aliased[name]
+        # Don't let lookups for names without aliases grow the defaultdict
+        return self.__aliased.get(name, ())
 
     # pylint: disable=unused-argument
     def get_symbol(self, name, prefer_class=False):
         """
         Banana banana
         """
-        if name in self.__symbols:
-            return self.__symbols.get(name)
+        sym = self.__symbols.get(name)
+        if sym is not None:
+            return sym
 
         return self.__aliases.get(name)
 
+    def get_symbols(self, names):
+        """
+        Looks up several symbols at once, see `get_symbol`.
+
+        Args:
+            names: iterable of str, the names to look up.
+
+        Returns:
+            list: the symbols, in the order of `names`, with None for
+                names that could not be found.
+        """
+        symbols = self.__symbols
+        aliases = self.__aliases
+        res = []
+        for name in names:
+            sym = symbols.get(name)
+            if sym is None:
+                sym = aliases.get(name)
+            res.append(sym)
+        return res
+
     def get_all_symbols(self):
         return self.__symbols
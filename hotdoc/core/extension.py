@@ -28,7 +28,7 @@ from hotdoc.core.formatter import Formatter
 from hotdoc.utils.configurable import Configurable
 from hotdoc.core.exceptions import InvalidPageMetadata, InvalidOutputException
 from hotdoc.utils.loggable import debug, info, warn, error, Logger
-from hotdoc.utils.utils import OrderedSet, DefaultOrderedDict
+from hotdoc.utils.utils import OrderedSet, DefaultOrderedDict, write_if_changed
 
 
 class SymbolListedTwiceException(InvalidPageMetadata):
@@ -119,6 +119,7 @@ class Extension(Configurable):
         self.source_roots = OrderedSet()
         self._created_symbols = DefaultOrderedDict(OrderedSet)
         self.__package_root = None
+        self.__roots = None
         self.__toplevel_comments = OrderedSet()
 
         self.formatter = self._make_formatter()
@@ -176,14 +177,14 @@ class Extension(Configurable):
         """
         self._created_symbols = DefaultOrderedDict(OrderedSet)
         self.__package_root = None
+        self.__roots = None
 
     def get_pagename(self, name):
         self.__find_package_root()
         # Find the longest prefix
         longest = None
-        for path in OrderedSet([self.__package_root]) | self.source_roots:
-            commonprefix = os.path.commonprefix([path, name])
-            if commonprefix == path and (longest is None or len(path) > len(longest)):
+        for path in self.__roots:
+            if name.startswith(path) and (longest is None or len(path) > len(longest)):
                 longest = path
 
         if longest is not None:
@@ -339,10 +340,14 @@ class Extension(Configurable):
                     continue
 
                 if source in self._created_symbols:
-                    symbol_names = OrderedSet(
-                        self._created_symbols[source]) - dispatched_symbol_names
+                    # Plain filtering against the dispatched set keeps
+                    # the creation order without going through the generic
+                    # MutableSet difference
+                    symbol_names = [
+                        name for name in self._created_symbols[source]
+                        if name not in dispatched_symbol_names]
                     page.symbol_names |= symbol_names
-                    dispatched_symbol_names |= symbol_names
+                    dispatched_symbol_names.update(symbol_names)
 
                 relocated_sources[source] = page.name
 
@@ -632,19 +637,20 @@ class Extension(Configurable):
     def get_possible_path(self, name):
         self.__find_package_root()
 
-        for path in OrderedSet([self.__package_root]) | self.source_roots:
+        for path in self.__roots:
             possible_path = os.path.join(path, name)
             if possible_path in self._get_all_sources():
                 return self._get_smart_filename(possible_path)
         return None
 
     def __find_package_root(self):
-        if self.__package_root:
+        if self.__roots is not None:
             return
 
         commonprefix = os.path.commonprefix(
             list(self._get_all_sources()) + list(self.source_roots))
         self.__package_root = os.path.dirname(commonprefix)
+        self.__roots = tuple(OrderedSet([self.__package_root]) | self.source_roots)
 
     def _get_smart_index_title(self):
         return 'Reference Manual'
@@ -693,8 +699,7 @@ class Extension(Configurable):
             Extension.formatted_sitemap = self.formatter.format_navigation(
                 self.app.project)
             if Extension.formatted_sitemap:
-                with open(opath, 'w') as _:
-                    _.write(Extension.formatted_sitemap)
+                write_if_changed(opath, Extension.formatted_sitemap)
 
         self.written_out_sitemaps.add(opath)
 
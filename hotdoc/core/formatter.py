@@ -29,15 +29,10 @@ import html
 import re
 import json
 import urllib.parse
-from urllib.request import urlretrieve
-import shutil
-import tarfile
 import hashlib
 
 from collections import namedtuple
 
-import appdirs
-
 from lxml import etree
 
 # pylint: disable=import-error
@@ -52,7 +47,8 @@ from hotdoc.core.symbols import *
 from hotdoc.core.links import Link
 from hotdoc.parsers.gtk_doc import GtkDocStringFormatter
 from hotdoc.utils.utils import (
-    OrderedSet, id_from_text, recursive_overwrite)
+    OrderedSet, id_from_text, recursive_overwrite, copy_if_changed,
+    write_if_changed)
 from hotdoc.core.exceptions import HotdocException
 from hotdoc.utils.loggable import Logger, warn, debug
 from hotdoc.utils.configurable import Configurable
@@ -82,6 +78,13 @@ XSLT_PAGE_TRANSFORM = etree.XML('''\
     </xsl:template>
 </xsl:stylesheet>''')
 
+# Everything __validate_html needs to look at in the main contents of a
+# page, fetched in a single traversal: title targets, links and assets
+MAIN_NODES_XPATH = etree.XPath(
+    './/*[@data-hotdoc-role="main"]//*[self::h1 or self::h2 or self::h3 or '
+    'self::h4 or self::h5 or self::img or self::a or @src]')
+TARGET_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'img'))
+
 
 Logger.register_warning_code('bad-local-link', FormatterBadLinkException,
                              domain='html-formatter')
@@ -262,7 +265,7 @@ class Formatter(Configurable):
             if os.path.isdir(src):
                 recursive_overwrite(src, dest)
             elif os.path.isfile(src):
-                shutil.copyfile(src, dest)
+                copy_if_changed(src, dest)
             paths.append(dest)
 
         return paths
@@ -285,7 +288,7 @@ class Formatter(Configurable):
             if not os.path.exists(destdir):
                 os.makedirs(destdir)
             if os.path.isfile(src):
-                shutil.copy(src, dest)
+                copy_if_changed(src, dest)
             elif os.path.isdir(src):
                 recursive_overwrite(src, dest)
 
@@ -341,19 +344,14 @@ class Formatter(Configurable):
         section_numbers[target.tag] += 1
         section_numbers['prev'] = cur
 
-        section_number = u''
-        for i in range(section_numbers['first'], cur + 1):
-            if section_number:
-                section_number += '.'
-            section_number += str(section_numbers['h%d' % i])
-
-        return section_number
+        return '.'.join(str(section_numbers['h%d' % i])
+                        for i in range(section_numbers['first'], cur + 1))
 
     def _make_title_id(self, node, id_nodes):
         if node.tag == 'img':
             text = node.attrib.get('alt')
         else:
-            text = "".join([x for x in node.itertext()])
+            text = "".join(node.itertext())
 
         if not text:
             return None
@@ -368,11 +366,7 @@ class Formatter(Configurable):
 
         return id_
 
-    def __update_targets(self, doc_root, section_numbers, id_nodes):
-        targets = doc_root.xpath(
-            './/*[@data-hotdoc-role="main"]//*[self::h1 or self::h2 or '
-            'self::h3 or self::h4 or self::h5 or self::img]')
-
+    def __update_targets(self, targets, section_numbers, id_nodes):
         for target in targets:
             if 'id' in target.attrib:
                 continue
@@ -391,16 +385,15 @@ class Formatter(Configurable):
             target.attrib['id'] = id_
             id_nodes[id_] = target
 
-    def __update_links(self, page, doc_root, id_nodes):
+    def __update_links(self, page, links, id_nodes):
         rel_path = os.path.join(self.get_output_folder(page), page.link.ref)
-        links = doc_root.xpath('.//*[@data-hotdoc-role="main"]//a')
         for link in links:
             href = link.attrib.get('href')
             if href and href.startswith('#'):
-                if not link.text and not link.getchildren():
+                if not link.text and len(link) == 0:
                     id_node = id_nodes.get(href.strip('#'))
                     if id_node is not None:
-                        link.text = ''.join([x for x in id_node.itertext()])
+                        link.text = ''.join(id_node.itertext())
                     else:
                         warn('bad-local-link',
                              "Empty anchor link to %s in %s points nowhere" %
@@ -413,11 +406,21 @@ class Formatter(Configurable):
 
         section_numbers = self.__init_section_numbers(doc_root)
 
-        self.__update_targets(doc_root, section_numbers, id_nodes)
+        targets = []
+        links = []
+        assets = []
+        for node in MAIN_NODES_XPATH(doc_root):
+            if node.tag in TARGET_TAGS:
+                targets.append(node)
+            elif node.tag == 'a':
+                links.append(node)
+            if 'src' in node.attrib:
+                assets.append(node)
 
-        self.__update_links(page, doc_root, id_nodes)
+        self.__update_targets(targets, section_numbers, id_nodes)
+
+        self.__update_links(page, links, id_nodes)
 
-        assets = doc_root.xpath('.//*[@data-hotdoc-role="main"]//*[@src]')
         # All required assets should now be in place
         for asset in assets:
             self.__lookup_asset(asset, project, page)
@@ -476,9 +479,8 @@ class Formatter(Configurable):
         self.__validate_html(self.extension.project, page, doc_root)
 
         self.writing_page_signal(self, page, full_path, doc_root)
-        with open(full_path, 'w', encoding='utf-8') as _:
-            transformed = str(self.__page_transform(doc_root))
-            _.write('<!DOCTYPE html>\n%s' % transformed)
+        transformed = str(self.__page_transform(doc_root))
+        write_if_changed(full_path, '<!DOCTYPE html>\n%s' % transformed)
 
     def cache_page(self, page):
         """
@@ -518,27 +520,27 @@ class Formatter(Configurable):
 
     # pylint: disable=unused-argument
     def _format_type_tokens(self, symbol, type_tokens):
-        out = ''
+        out = []
         link_before = False
 
         for tok in type_tokens:
             if isinstance(tok, Link):
                 ref, attrs = tok.get_link(self.extension.app.link_resolver)
                 if ref:
-                    out += self._format_link(ref, attrs, tok.title)
+                    out.append(self._format_link(ref, attrs, tok.title))
                     link_before = True
                 else:
                     if link_before:
-                        out += ' '
-                    out += tok.title
+                        out.append(' ')
+                    out.append(tok.title)
                     link_before = False
             else:
                 if link_before:
-                    out += ' '
-                out += tok
+                    out.append(' ')
+                out.append(tok)
                 link_before = False
 
-        return out
+        return ''.join(out)
 
     # pylint: disable=unidiomatic-typecheck
     def _format_linked_symbol(self, symbol):
@@ -1038,6 +1040,14 @@ class Formatter(Configurable):
                            help="Enable html headings numbering")
 
     def __download_theme(self, uri):
+        # These are only needed for remote themes, avoid paying for them
+        # on every startup
+        # pylint: disable=import-outside-toplevel
+        import tarfile
+        import urllib.error
+        from urllib.request import urlretrieve
+        import appdirs
+
         sha = urllib.parse.parse_qs(uri.query).get('sha256')
         cachedir = appdirs.user_cache_dir("hotdoc", "hotdoc")
         os.makedirs(cachedir, exist_ok=True)
@@ -1122,7 +1132,7 @@ class Formatter(Configurable):
 
             if os.path.exists(theme_meta_path):
                 with open(theme_meta_path, 'r') as _:
-                    Formatter.theme_meta = json.loads(_.read())
+                    Formatter.theme_meta = json.load(_)
 
             searchpath = []
             self.__load_theme_templates(searchpath, HERE)
@@ -52,7 +52,7 @@ def find_file(filename, include_paths):
 
     for include_path in include_paths:
         fpath = os.path.join(include_path, filename)
-        if os.path.exists(fpath) and os.path.isfile(fpath):
+        if os.path.isfile(fpath):
             return (fpath, include_path)
 
     return (None, None)
@@ -22,8 +22,6 @@ Core of the core.
 import os
 import io
 import re
-import linecache
-import shutil
 import urllib.parse
 
 from collections import OrderedDict
@@ -37,7 +35,7 @@ from hotdoc.core.config import Config
 from hotdoc.core.tree import Tree
 from hotdoc.utils.loggable import info, error
 from hotdoc.utils.configurable import Configurable
-from hotdoc.utils.utils import OrderedSet
+from hotdoc.utils.utils import OrderedSet, copy_if_changed
 from hotdoc.utils.signals import Signal
 from hotdoc.parsers.sitemap import SitemapParser
 
@@ -92,18 +90,20 @@ class CoreExtension(Extension):
                 ext = split[1].strip('.')
                 lang = LANG_MAPPING.get(ext) or ext
 
-        if line_ranges:
-            res = []
-            for line_range in line_ranges:
-                for lineno in range(line_range[0] + 1, line_range[1] + 1):
-                    line = linecache.getline(include_path, lineno)
-                    if not line:
-                        return None
-                    res.append(line)
-            return ''.join(res), lang
-
         with io.open(include_path, 'r', encoding='utf-8') as _:
-            return _.read(), lang
+            if not line_ranges:
+                return _.read(), lang
+            lines = _.readlines()
+
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+
+        res = []
+        for start, end in line_ranges:
+            if start < end and end > len(lines):
+                return None
+            res.extend(lines[start:end])
+        return ''.join(res), lang
 
 
 # pylint: disable=too-many-instance-attributes
@@ -168,7 +168,11 @@ class Project(Configurable):
     # pylint: disable=no-self-use
     def get_private_folder(self):
         """
-        Banana banana
+        Get the absolute path to the private folder of the application.
+
+        The path is resolved once, in `Application.parse_config`, and
+        shared by all projects; this assumes the working directory does
+        not change for the duration of a run.
         """
         return self.app.private_folder
 
@@ -293,7 +297,7 @@ class Project(Configurable):
         self.extra_asset_folders = OrderedSet(config.get_paths('extra_assets'))
 
     def __add_default_tags(self, _, comment):
-        for validator in list(self.tag_validators.values()):
+        for validator in self.tag_validators.values():
             if validator.default and validator.name not in comment.tags:
                 comment.tags[validator.name] = \
                     Tag(name=validator.name,
@@ -314,7 +318,7 @@ class Project(Configurable):
             destdir = os.path.dirname(dest)
             if not os.path.exists(destdir):
                 os.makedirs(destdir)
-            shutil.copyfile(src, dest)
+            copy_if_changed(src, dest)
 
         for proj in self.subprojects.values():
             proj.write_extra_assets(output)
@@ -24,6 +24,8 @@ here for the while, subclassing will be formalized in the
 future.
 """
 
+import itertools
+
 from hotdoc.core.comment import comment_from_tag
 from hotdoc.core.links import Link
 
@@ -71,9 +73,7 @@ class Symbol:
         """
         Banana banana
         """
-        attributes = self.extension_attributes.pop(ext_name, {})
-        attributes[key] = value
-        self.extension_attributes[ext_name] = attributes
+        self.extension_attributes.setdefault(ext_name, {})[key] = value
 
     def get_extension_attribute(self, ext_name, key):
         """
@@ -166,9 +166,7 @@ class QualifiedSymbol:
         """
         Banana banana
         """
-        attributes = self.extension_attributes.pop(ext_name, {})
-        attributes[key] = value
-        self.extension_attributes[ext_name] = attributes
+        self.extension_attributes.setdefault(ext_name, {})[key] = value
 
     def get_extension_attribute(self, ext_name, key):
         """
@@ -513,8 +511,9 @@ class ClassSymbol(StructSymbol):
         return "Class"
 
     def get_children_symbols(self):
-        return self.hierarchy + list(
-            self.children.values()) + super().get_children_symbols()
+        return list(itertools.chain(
+            self.hierarchy, self.children.values(),
+            super().get_children_symbols()))
 
 
 class InterfaceSymbol(ClassSymbol):
@@ -187,6 +187,40 @@ class TestConfig(unittest.TestCase):
             ncfg.get('test_sources'),
             [u'../overridden_sources/*.x'])
 
+    def test_dump_unchanged(self):
+        conf_file = os.path.join(self.__priv_dir, 'test.json')
+        with open(conf_file, 'w') as _:
+            _.write('{"index": "my_index.markdown"}\n')
+
+        cfg = Config(conf_file=conf_file)
+        cfg.dump(conf_file=conf_file)
+        mtime = os.stat(conf_file).st_mtime_ns
+        os.utime(conf_file, ns=(mtime - 10 ** 9, mtime - 10 ** 9))
+        cfg.dump(conf_file=conf_file)
+        self.assertEqual(os.stat(conf_file).st_mtime_ns, mtime - 10 ** 9)
+        self.assertListEqual(os.listdir(self.__priv_dir), ['test.json'])
+
+    def test_dump_through_symlink(self):
+        shared_dir = os.path.join(self.__priv_dir, 'shared')
+        os.mkdir(shared_dir)
+        shared_conf = os.path.join(shared_dir, 'test.json')
+        with open(shared_conf, 'w') as _:
+            _.write('{"project_name": "foo"}\n')
+
+        conf_file = os.path.join(self.__priv_dir, 'test.json')
+        os.symlink(shared_conf, conf_file)
+
+        cfg = Config(command_line_args={'project_version': '1.0'},
+                     conf_file=conf_file)
+        cfg.dump(conf_file=conf_file)
+
+        # The link is kept, and the shared file was updated through it
+        self.assertTrue(os.path.islink(conf_file))
+        self.assertEqual(os.path.realpath(conf_file), shared_conf)
+        self.assertEqual(Config(conf_file=shared_conf).get('project_version'),
+                         '1.0')
+        self.assertListEqual(os.listdir(shared_dir), ['test.json'])
+
     def test_path(self):
         conf_file = os.path.join(self.__priv_dir, 'test.json')
         with open(conf_file, 'w') as _:
@@ -16,7 +16,11 @@
 # along with this library.  If not, see <http://www.gnu.org/licenses/>.
 
 # pylint: disable=missing-docstring
+import os
+import json
+
 from hotdoc.tests.fixtures import HotdocTest
+from hotdoc.core.comment import Comment
 from hotdoc.core.database import Database, RedefinedSymbolException
 from hotdoc.core.symbols import FunctionSymbol
 from hotdoc.utils.loggable import Logger
@@ -39,3 +43,37 @@ class TestDatabase(HotdocTest):
         Logger.fatal_warnings = False
         Logger.silent = False
         Logger.reset()
+
+    def test_persist(self):
+        self.database.create_symbol(
+            FunctionSymbol,
+            unique_name='foo')
+        self.database.persist()
+
+        with open(os.path.join(self.private_folder, 'symbol_index.json')) as _:
+            self.assertEqual(json.load(_), ['foo'])
+
+        # The temporary files used for atomic writes should be gone
+        self.assertEqual(sorted(os.listdir(self.private_folder)),
+                         ['all_comments.json', 'symbol_index.json'])
+
+    def test_persist_comments(self):
+        self.database.add_comment(Comment(name='foo', description='bar'))
+        self.database.persist()
+
+        with open(os.path.join(self.private_folder, 'all_comments.json')) as _:
+            comment = json.load(_)['foo']
+        self.assertEqual(comment['description'], 'bar')
+        self.assertNotIn('extension_attrs', comment)
+
+    def test_get_symbols(self):
+        foo = self.database.create_symbol(
+            FunctionSymbol,
+            unique_name='foo',
+            aliases=['foo_alias'])
+        bar = self.database.create_symbol(
+            FunctionSymbol,
+            unique_name='bar')
+        self.assertListEqual(
+            self.database.get_symbols(['bar', 'nope', 'foo_alias', 'foo']),
+            [bar, None, foo, foo])
@@ -57,6 +57,13 @@ class TestFileIncluder(HotdocTest):
         _ = self._create_md_file('yep.md', 'foo\nbar\nbaz\nfoobar\n')
         self.assertEqual(resolve('yep.md[1:3]', [self._md_dir]), 'bar\nbaz\n')
 
+    def test_resolve_linenos_updated_file(self):
+        _ = self._create_md_file('yep.md', 'foo\nbar\n')
+        self.assertEqual(resolve('yep.md[0:1]', [self._md_dir]), 'foo\n')
+        _ = self._create_md_file('yep.md', 'baz\nfoobar')
+        self.assertEqual(resolve('yep.md[0:2]', [self._md_dir]),
+                         'baz\nfoobar\n')
+
     def test_resolve_different_lang(self):
         _ = self._create_src_file('yep.x', ['foo', 'bar', 'baz'])
         self.assertEqual(resolve('yep.x', [self._src_dir]),
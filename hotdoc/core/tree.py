@@ -25,6 +25,7 @@ import io
 import re
 import os
 import pathlib
+import itertools
 from urllib.parse import urlparse
 from collections import namedtuple, defaultdict, OrderedDict
 
@@ -42,7 +43,7 @@ from hotdoc.core.exceptions import HotdocSourceException, InvalidPageMetadata
 from hotdoc.core.comment import Comment
 # pylint: disable=no-name-in-module
 from hotdoc.parsers import cmark
-from hotdoc.utils.utils import OrderedSet, all_subclasses
+from hotdoc.utils.utils import OrderedSet, all_subclasses, nested_defaultdict
 from hotdoc.utils.signals import Signal
 from hotdoc.utils.loggable import info, debug, warn, error, Logger
 
@@ -91,6 +92,14 @@ Logger.register_warning_code('invalid-page-metadata', InvalidPageMetadata,
                              domain='doc-tree')
 Logger.register_warning_code('markdown-bad-link', HotdocSourceException)
 
+PAGE_REF_REGEX = re.compile(r'\W+')
+
+TypedSymbolsList = namedtuple('TypedSymbolsList', ['name', 'symbols'])
+
+# Symbol types, in order of preference, whose first symbol provides the
+# title of a page lacking one
+TITLE_SYMBOL_TYPES = (ClassSymbol, AliasSymbol, InterfaceSymbol, StructSymbol)
+
 
 # pylint: disable=too-many-instance-attributes
 class Page:
@@ -127,8 +136,7 @@ class Page:
         self.name = name
         basename = os.path.basename(name)
         name = os.path.splitext(basename)[0]
-        ref = os.path.join(output_path,
-                           re.sub(r'\W+', '-', os.path.splitext(basename)[0]))
+        ref = os.path.join(output_path, PAGE_REF_REGEX.sub('-', name))
         pagename = '%s.html' % ref
 
         self.generated = generated
@@ -145,7 +153,8 @@ class Page:
         self.subpages = OrderedSet()
         self.symbols = []
         self.private_symbols = []
-        self.typed_symbols = OrderedDict()
+        self.typed_symbols = {}
+        # An OrderedDict, as formatters may reorder it with move_to_end
         self.by_parent_symbols = OrderedDict()
         self.formatted_contents = None
         self.detailed_description = None
@@ -160,9 +169,10 @@ class Page:
             meta = {}
 
         self.meta = {}
+        schema = Schema(Page.meta_schema)
         for key, value in meta.items():
             try:
-                self.meta.update(Schema(Page.meta_schema).validate({
+                self.meta.update(schema.validate({
                     key.replace('_', '-').lower(): value}))
             except SchemaError as err:
                 warn('invalid-page-metadata',
@@ -184,16 +194,16 @@ class Page:
         return "<Page %s>" % self.name
 
     @staticmethod
-    def __get_empty_typed_symbols():
-        typed_symbols_list = namedtuple(
-            'TypedSymbolsList', ['name', 'symbols'])
-        empty_typed_symbols = {}
-
-        for subclass in all_subclasses(Symbol):
-            empty_typed_symbols[subclass] = typed_symbols_list(
-                subclass.get_plural_name(), [])
+    def __get_typed_symbols_sections():
+        # Extensions may define new symbol types at any point, so this is
+        # only computed once per page, not once and for all
+        return [(subclass, subclass.get_plural_name())
+                for subclass in all_subclasses(Symbol)]
 
-        return empty_typed_symbols
+    @staticmethod
+    def __get_empty_typed_symbols(sections):
+        return {subclass: TypedSymbolsList(name, [])
+                for subclass, name in sections}
 
     def resolve_symbols(self, tree, database, link_resolver):
         """
@@ -201,10 +211,10 @@ class Page:
         from `database`, and added to lists of actual symbols, sorted
         by symbol class.
         """
-        self.typed_symbols = self.__get_empty_typed_symbols()
+        sections = self.__get_typed_symbols_sections()
+        self.typed_symbols = self.__get_empty_typed_symbols(sections)
         all_syms = OrderedSet()
-        for sym_name in self.symbol_names:
-            sym = database.get_symbol(sym_name)
+        for sym in database.get_symbols(self.symbol_names):
             self.__query_extra_symbols(
                 sym, all_syms, tree, link_resolver, database)
 
@@ -217,7 +227,7 @@ class Page:
             all_syms = sorted(all_syms, key=lambda x: x.unique_name)
         for sym in all_syms:
             sym.update_children_comments()
-            self.__resolve_symbol(sym, link_resolver, page_path)
+            self.__resolve_symbol(sym, link_resolver, page_path, sections)
             self.symbol_names.add(sym.unique_name)
 
         # Always put symbols with no parent at the end
@@ -225,8 +235,7 @@ class Page:
         if no_parent_syms:
             self.by_parent_symbols[None] = no_parent_syms
 
-        for sym_type in [ClassSymbol, AliasSymbol, InterfaceSymbol,
-                         StructSymbol]:
+        for sym_type in TITLE_SYMBOL_TYPES:
             syms = self.typed_symbols[sym_type].symbols
 
             if not syms:
@@ -320,7 +329,7 @@ class Page:
         if not self.__redirect_if_needed(formatter, link_resolver):
             self.__format_content(formatter, link_resolver)
 
-        self.output_attrs = defaultdict(lambda: defaultdict(dict))
+        self.output_attrs = nested_defaultdict()
         formatter.prepare_page_attributes(self)
         self.__format_symbols(formatter, link_resolver)
         self.detailed_description =\
@@ -357,13 +366,14 @@ class Page:
             self.__fetch_comment(sym, database)
             all_syms.add(sym)
 
-    def __resolve_symbol(self, symbol, link_resolver, page_path):
+    def __resolve_symbol(self, symbol, link_resolver, page_path, sections):
         symbol.resolve_links(link_resolver)
 
-        symbol.link.ref = "%s#%s" % (page_path, symbol.unique_name)
+        prefix = page_path + '#'
+        symbol.link.ref = prefix + symbol.unique_name
 
         for link in symbol.get_extra_links():
-            link.ref = "%s#%s" % (page_path, link.id_)
+            link.ref = prefix + str(link.id_)
 
         tsl = self.typed_symbols.get(type(symbol))
         if tsl:
@@ -371,7 +381,7 @@ class Page:
 
             by_parent_symbols = self.by_parent_symbols.get(symbol.parent_name)
             if not by_parent_symbols:
-                by_parent_symbols = self.__get_empty_typed_symbols()
+                by_parent_symbols = self.__get_empty_typed_symbols(sections)
                 parent_name = symbol.parent_name
                 if parent_name is None:
                     parent_name = 'Others symbols'
@@ -397,16 +407,10 @@ class Tree:
 
         self.root = None
         self.__dep_map = project.dependency_map
-        self.__fill_dep_map()
 
         cmark.hotdoc_to_ast(u'', self, None)
         self.__extensions = {}
 
-    def __fill_dep_map(self):
-        for page in list(self.__all_pages.values()):
-            for sym_name in page.symbol_names:
-                self.__dep_map[sym_name] = page
-
     # pylint: disable=no-self-use
     def parse_page(self, source_file, include_path, extension_name):
         with io.open(source_file, 'r', encoding='utf-8') as _:
@@ -507,8 +511,7 @@ class Tree:
 
     # pylint: disable=no-self-use
     def __setup_folder(self, folder):
-        if not os.path.exists(folder):
-            os.makedirs(folder)
+        os.makedirs(folder, exist_ok=True)
 
     def __get_link_cb(self, link_resolver, name):
         url_components = urlparse(name)
@@ -545,11 +548,30 @@ class Tree:
             yield self.root
             parent = self.root
 
-        for cpage_name in parent.subpages:
-            cpage = self.__all_pages[cpage_name]
-            yield cpage
-            for page in self.walk(parent=cpage):
-                yield page
+        # Explicit stack of subpage iterators, a recursive generator would
+        # have every yield bubble up through each level of the tree
+        stack = [iter(parent.subpages)]
+        while stack:
+            for cpage_name in stack[-1]:
+                cpage = self.__all_pages[cpage_name]
+                yield cpage
+                stack.append(iter(cpage.subpages))
+                break
+            else:
+                stack.pop()
+
+    @staticmethod
+    def __walk_symbols(symbols):
+        stack = [iter(symbols)]
+        while stack:
+            for sym in stack[-1]:
+                if not isinstance(sym, Symbol):
+                    continue
+                yield sym
+                stack.append(iter(sym.get_children_symbols()))
+                break
+            else:
+                stack.pop()
 
     def page_from_raw_text(self, source_file, include_path, contents, extension_name):
         """
@@ -587,33 +609,26 @@ class Tree:
         return self.__all_pages
 
     def __update_dep_map(self, page, symbols):
-        for sym in symbols:
-            if not isinstance(sym, Symbol):
-                continue
-
+        for sym in self.__walk_symbols(symbols):
             self.__dep_map[sym.unique_name] = page
-            self.__update_dep_map(page, sym.get_children_symbols())
 
     def resolve_symbols(self, database, link_resolver, page=None):
         """Will call resolve_symbols on all the stale subpages of the tree.
         Args:
           page: hotdoc.core.tree.Page, the page to resolve symbols in,
-          will recurse on potential subpages.
+          along with all of its subpages.
         """
 
         page = page or self.root
 
-        if page.ast is None and not page.generated:
-            with io.open(page.source_file, 'r', encoding='utf-8') as _:
-                page.ast = cmark.hotdoc_to_ast(
-                    _.read(), self, page.source_file)
-
-        page.resolve_symbols(self, database, link_resolver)
-        self.__update_dep_map(page, page.symbols)
+        for cpage in itertools.chain((page,), self.walk(parent=page)):
+            if cpage.ast is None and not cpage.generated:
+                with io.open(cpage.source_file, 'r', encoding='utf-8') as _:
+                    cpage.ast = cmark.hotdoc_to_ast(
+                        _.read(), self, cpage.source_file)
 
-        for pagename in page.subpages:
-            cpage = self.__all_pages[pagename]
-            self.resolve_symbols(database, link_resolver, page=cpage)
+            cpage.resolve_symbols(self, database, link_resolver)
+            self.__update_dep_map(cpage, cpage.symbols)
 
     def format_page(self, page, link_resolver, output, extensions):
         """
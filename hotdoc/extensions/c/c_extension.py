@@ -152,7 +152,7 @@ class ClangScanner(object):
         args.append("-isystem%s" % CLANG_HEADERS)
         args.extend(options)
         self.symbols = {}
-        self.parsed = set({})
+        self.parsed = set()
 
         debug('CFLAGS %s' % ' '.join(args))
 
@@ -91,7 +91,7 @@ class DBusScanner(object):
 
         if comment:
             comment.col_offset = column_offset + 1
-            for param in list(comment.params.values()):
+            for param in comment.params.values():
                 param.col_offset = comment.col_offset
 
         if unique_name and comment:
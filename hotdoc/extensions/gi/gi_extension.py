@@ -168,9 +168,9 @@ class GIExtension(Extension):
 
     def __list_relocated_symbols(self):
         for comment in self._get_toplevel_comments():
-            self.__relocated_symbols |= set(comment.meta.get('symbols', []))
-            self.__relocated_symbols |= set(
-                comment.meta.get('private-symbols', []))
+            self.__relocated_symbols.update(comment.meta.get('symbols', ()))
+            self.__relocated_symbols.update(
+                comment.meta.get('private-symbols', ()))
 
     def setup(self):
         for ext in self.project.extensions.values():
@@ -110,9 +110,9 @@ def __update_hierarchies(cur_ns, node, gi_name):
 
 
 def __get_parent_link_recurse(gi_name, res):
-    parents = list(__HIERARCHY_GRAPH.predecessors(gi_name))
-    if parents:
-        __get_parent_link_recurse(list(parents)[0], res)
+    parent = next(__HIERARCHY_GRAPH.predecessors(gi_name), None)
+    if parent is not None:
+        __get_parent_link_recurse(parent, res)
     ctype_name = ALL_GI_TYPES[gi_name]
     qs = QualifiedSymbol(type_tokens=[Link(None, ctype_name, ctype_name)])
     qs.add_extension_attribute('gi-extension', 'type_desc',
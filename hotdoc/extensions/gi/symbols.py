@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this library.  If not, see <http://www.gnu.org/licenses/>.
 
+import itertools
+
 from hotdoc.core.symbols import *
 from hotdoc.extensions.devhelp.devhelp_extension import TYPE_MAP
 
@@ -30,12 +32,13 @@ class GIClassSymbol(ClassSymbol):
         ClassSymbol.__init__(self, **kwargs)
 
     def get_children_symbols(self):
-        res = self.interfaces + self.properties + self.methods + \
-            self.signals + self.vfuncs + super().get_children_symbols()
+        res = list(itertools.chain(
+            self.interfaces, self.properties, self.methods, self.signals,
+            self.vfuncs, super().get_children_symbols()))
 
         if self.class_struct_symbol:
-            res += [self.class_struct_symbol] + \
-                self.class_struct_symbol.get_children_symbols()
+            res.append(self.class_struct_symbol)
+            res.extend(self.class_struct_symbol.get_children_symbols())
 
         return res
 
@@ -50,11 +53,12 @@ class GIInterfaceSymbol(InterfaceSymbol):
         InterfaceSymbol.__init__(self, **kwargs)
 
     def get_children_symbols(self):
-        res = self.properties + self.methods + self.signals + \
-            self.vfuncs + super().get_children_symbols()
+        res = list(itertools.chain(
+            self.properties, self.methods, self.signals, self.vfuncs,
+            super().get_children_symbols()))
         if self.class_struct_symbol:
-            res += [self.class_struct_symbol] + \
-                self.class_struct_symbol.get_children_symbols()
+            res.append(self.class_struct_symbol)
+            res.extend(self.class_struct_symbol.get_children_symbols())
 
         return res
 
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2016 Mathieu Duponchelle <mathieu.duponchelle@opencreed.com>
+# Copyright © 2016 Collabora Ltd
+#
+# This library is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+import tempfile
+import unittest
+from unittest import mock
+
+from hotdoc.core.formatter import Formatter
+from hotdoc.core.tree import Page
+from hotdoc.extensions.gst.gst_extension import GstFormatter
+
+
+class TestGstFormatter(unittest.TestCase):
+    def test_unparented_symbols_first(self):
+        page = Page('some-page', True, 'test-project-0.1', 'gst-extension')
+        page.by_parent_symbols['GstFoo'] = 'foo-symbols'
+        page.by_parent_symbols[None] = 'unparented-symbols'
+
+        extension = mock.Mock()
+        extension.app.private_folder = tempfile.gettempdir()
+        formatter = GstFormatter(extension)
+
+        # Only the reordering done by the gst formatter is under test
+        with mock.patch.object(Formatter, '_format_page',
+                               lambda self, page: list(
+                                   page.by_parent_symbols)):
+            self.assertListEqual(formatter._format_page(page),
+                                 [None, 'GstFoo'])
@@ -33,6 +33,34 @@ for html documentation produced by hotdoc.
 """
 
 HERE = os.path.dirname(__file__)
+SCRIPT_PATH = os.path.abspath(os.path.join(HERE, 'trie.js'))
+
+# Folders that never hold pages, and thus need no link to the trie
+TRIE_EXCLUDED_DIRS = frozenset(('assets',))
+
+
+def _walk_subdirs(top, exclude=frozenset()):
+    """
+    Yields the `os.DirEntry` of every folder below @top, pruning the
+    folders named in @exclude along with their contents.
+
+    Like `os.walk` without `followlinks`, symlinks to folders are yielded
+    but not descended into. Each folder is listed with a single scandir
+    call, and entries are not stat'ed again nor joined into paths.
+    """
+    stack = [top]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name in exclude:
+                        continue
+                    if entry.is_dir():
+                        yield entry
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+        except OSError:
+            continue
 
 
 class SearchExtension(Extension):
@@ -44,7 +72,7 @@ class SearchExtension(Extension):
     def __init__(self, app, project):
         Extension.__init__(self, app, project)
         self.__all_paths = []
-        self.script = os.path.abspath(os.path.join(HERE, 'trie.js'))
+        self.script = SCRIPT_PATH
 
     def setup(self):
         super(SearchExtension, self).setup()
@@ -77,6 +105,11 @@ class SearchExtension(Extension):
         self.__all_paths.append(path)
 
     def __build_index(self, app):  # pylint: disable=unused-argument
+        # Nothing was written out, eg. no output folder was provided:
+        # there is nothing to index nor to walk
+        if not self.__all_paths:
+            return
+
         html_dir = os.path.join(self.app.output, 'html')
         search_dir = os.path.join(html_dir, 'assets', 'js', 'search')
         fragments_dir = os.path.join(search_dir, 'hotdoc_fragments')
@@ -88,23 +121,19 @@ class SearchExtension(Extension):
                             fragments_dir, html_dir, self.app.project.get_private_folder(),
                             os.path.join(HERE, 'stopwords.txt'))
 
-        subdirs = next(os.walk(html_dir))[1]
-        subdirs.append(html_dir)
-
-        dumped_trie_path = os.path.join(html_dir, 'dumped.trie')
-        # pylint: disable=unused-variable
-        for root, dirs, files in os.walk(html_dir):
-            for dir_ in dirs:
-                if dir_ == 'assets':
-                    continue
-                dest_trie = os.path.join(root, dir_, 'dumped.trie')
-                try:
-                    os.remove(dest_trie)
-                except OSError:
-                    pass
-
-                symlink(os.path.relpath(
-                    dumped_trie_path, os.path.join(root, dir_)), dest_trie)
+        # The trie lives at the root of html_dir, the link target only
+        # depends on how deep below it each folder is
+        parent_ref = os.pardir + os.sep
+        html_dir_len = len(html_dir)
+        for entry in _walk_subdirs(html_dir, TRIE_EXCLUDED_DIRS):
+            dest_trie = os.path.join(entry.path, 'dumped.trie')
+            try:
+                os.remove(dest_trie)
+            except OSError:
+                pass
+
+            depth = entry.path.count(os.sep, html_dir_len)
+            symlink(parent_ref * depth + 'dumped.trie', dest_trie)
 
     # pylint: disable=unused-argument
     def __formatting_page(self, formatter, page):
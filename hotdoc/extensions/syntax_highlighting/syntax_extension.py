@@ -36,6 +36,16 @@ snippets.
 
 HERE = os.path.dirname(__file__)
 
+# Added to every formatted page, in this order
+PRISM_SCRIPTS = (
+    os.path.join(HERE, 'prism', 'components', 'prism-core.js'),
+    os.path.join(HERE, 'prism', 'plugins', 'autoloader',
+                 'prism-autoloader.js'),
+    os.path.join(HERE, 'prism_autoloader_path_override.js'),
+)
+PRISM_KEEP_MARKUP_SCRIPT = os.path.join(
+    HERE, 'prism', 'plugins', 'keep-markup', 'prism-keep-markup.js')
+
 
 Logger.register_warning_code('syntax-invalid-theme', ConfigError,
                              'syntax-extension')
@@ -78,17 +88,10 @@ class SyntaxHighlightingExtension(Extension):
             warn('syntax-invalid-theme', 'Prism has no theme named %s' %
                  prism_light_theme)
 
-        page.output_attrs['html']['scripts'].add(
-            os.path.join(HERE, 'prism', 'components', 'prism-core.js'))
-        page.output_attrs['html']['scripts'].add(
-            os.path.join(HERE, 'prism', 'plugins', 'autoloader',
-                         'prism-autoloader.js'))
-        page.output_attrs['html']['scripts'].add(
-            os.path.join(HERE, 'prism_autoloader_path_override.js'))
+        scripts = page.output_attrs['html']['scripts']
+        scripts |= PRISM_SCRIPTS
         if self.keep_markup:
-            page.output_attrs['html']['scripts'].add(
-                os.path.join(HERE, 'prism', 'plugins', 'keep-markup',
-                             'prism-keep-markup.js'))
+            scripts.add(PRISM_KEEP_MARKUP_SCRIPT)
 
         folder = os.path.join('html', 'assets', 'prism_components')
         self.__asset_folders.add(folder)
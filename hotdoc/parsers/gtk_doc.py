@@ -52,6 +52,17 @@ GTKDOC_HREFS = {}
 GATHERED_GTKDOC_LINKS = False
 
 
+# These are applied to every comment we parse, compile them once
+PARAMS_SPLIT_REGEX = re.compile(r'(\n[ \t]*@[\S]+[ \t]*:)')
+COMMENT_START_REGEX = re.compile(r'^[\W]*\/[\*]+[\W]*')
+COMMENT_END_REGEX = re.compile(r'\*\/[\W]*$')
+COMMENT_LINE_START_REGEX = re.compile(r'\n[ \t]*\*')
+C_COMMENT_REGEX = re.compile(
+    r'(/\*\*([^*]|[\r\n]|(\*+([^*/]|[\r\n])))*\*+/)$')
+PARAGRAPH_SPLIT_REGEX = re.compile(r'\n[\s]*\n')
+XML_TAG_REGEX = re.compile('<.*?>')
+
+
 # http://stackoverflow.com/questions/434287/what-is-the-most-pythonic-way-to-iterate-over-a-list-in-chunks
 def _grouper(iterable, n_args, fillvalue=None):
     """
@@ -92,6 +103,17 @@ class GtkDocParser:
         self.tag_validation_regex = re.compile(tag_validation_regex)
         self.__section_file_matching = section_file_matching
 
+        # lowercased tag name -> (parsing method, name to give the tag,
+        # None to keep the name as written)
+        self.__tag_parsers = {
+            'since': (self.__parse_since_tag, None),
+            'returns': (self.__parse_returns_tag, None),
+            'return value': (self.__parse_returns_tag, 'returns'),
+            'stability': (self.__parse_stability_tag, 'stability'),
+            'deprecated': (self.__parse_deprecated_tag, 'deprecated'),
+            'topic': (self.__parse_topic_tag, 'topic'),
+        }
+
     def __parse_title(self, source_filename, raw_title):
         if raw_title.startswith('SECTION'):
             section_name = raw_title.split('SECTION:')[1].strip()
@@ -112,7 +134,7 @@ class GtkDocParser:
 
     def __parse_key_value_annotation(self, name, string):
         kvs = self.kv_regex.findall(string)
-        kvs = {kv.split('=', 1)[0]: kv.split('=', 1)[1] for kv in kvs}
+        kvs = dict(kv.split('=', 1) for kv in kvs)
         return Annotation(name=name, argument=kvs)
 
     def __parse_annotation(self, string):
@@ -177,7 +199,7 @@ class GtkDocParser:
                        meta={'description': desc}, raw_comment=raw_comment)
 
     def __parse_title_and_parameters(self, filename, title_and_params):
-        tps = re.split(r'(\n[ \t]*@[\S]+[ \t]*:)', title_and_params)
+        tps = PARAMS_SPLIT_REGEX.split(title_and_params)
         title, annotations, is_section = self.__parse_title(filename, tps[0])
         parameters = []
         for name, desc in _grouper(tps[1:], 2):
@@ -222,20 +244,11 @@ class GtkDocParser:
                        annotations}
         return Tag(name, desc, annotations=annotations)
 
-    # pylint: disable=too-many-return-statements
     def __parse_tag(self, name, desc):
-        if name.lower() == "since":
-            return self.__parse_since_tag(name, desc)
-        if name.lower() == "returns":
-            return self.__parse_returns_tag(name, desc)
-        if name.lower() == "return value":
-            return self.__parse_returns_tag("returns", desc)
-        if name.lower() == "stability":
-            return self.__parse_stability_tag("stability", desc)
-        if name.lower() == "deprecated":
-            return self.__parse_deprecated_tag("deprecated", desc)
-        if name.lower() == "topic":
-            return self.__parse_topic_tag("topic", desc)
+        tag_parser = self.__tag_parsers.get(name.lower())
+        if tag_parser:
+            parse_func, tag_name = tag_parser
+            return parse_func(tag_name or name, desc)
 
         validator = self.project.tag_validators.get(name)
         if not validator:
@@ -254,27 +267,27 @@ class GtkDocParser:
         if len(dts) == 1:
             return desc, tags
 
+        desc = [desc]
         # pylint: disable=unused-variable
         for raw, name, tag_desc in _grouper(dts[1:], 3):
             tag = self.__parse_tag(name.strip(), tag_desc.strip())
             if tag:
                 tags.append(tag)
             else:
-                desc += '\n%s: %s' % (name, tag_desc)
+                desc.append('\n%s: %s' % (name, tag_desc))
 
-        return desc, tags
+        return ''.join(desc), tags
 
     def __strip_comment(self, comment):
         n_lines = len(comment.split('\n'))
-        comment = re.sub(r'^[\W]*\/[\*]+[\W]*', '', comment)
+        comment = COMMENT_START_REGEX.sub('', comment)
         title_offset = n_lines - len(comment.split('\n'))
-        comment = re.sub(r'\*\/[\W]*$', '', comment)
-        comment = re.sub(r'\n[ \t]*\*', '\n', comment)
+        comment = COMMENT_END_REGEX.sub('', comment)
+        comment = COMMENT_LINE_START_REGEX.sub('\n', comment)
         return comment.strip(), title_offset
 
     def __validate_c_comment(self, comment):
-        return re.match(r'(/\*\*([^*]|[\r\n]|(\*+([^*/]|[\r\n])))*\*+/)$',
-                        comment) is not None
+        return C_COMMENT_REGEX.match(comment) is not None
 
     def __parse_yaml_comment(self, comment, filename):
         res = {}
@@ -289,8 +302,8 @@ class GtkDocParser:
         return res
 
     def __extract_titles_params_and_description(self, comment):
-        titleandparams_description = re.split(
-            r'\n[\s]*\n', comment, maxsplit=1)
+        titleandparams_description = PARAGRAPH_SPLIT_REGEX.split(
+            comment, maxsplit=1)
         title_and_params = titleandparams_description[0]
 
         title_and_params_lines = title_and_params.split('\n')
@@ -437,7 +450,7 @@ class GtkDocStringFormatter(Configurable):
 
         if (self.remove_xml_tags or comment.filename in
                 self.gdbus_codegen_sources):
-            text = re.sub('<.*?>', '', text)
+            text = XML_TAG_REGEX.sub('', text)
 
         if self.escape_html:
             text = html.escape(text)
@@ -159,12 +159,12 @@ class Application(Configurable):
         self.project.finalize()
 
     def __setup_private_folder(self):
-        if os.path.exists(self.private_folder):
+        try:
+            os.mkdir(self.private_folder)
+        except FileExistsError:
             if not os.path.isdir(self.private_folder):
                 error('setup-issue',
                       '%s exists but is not a directory' % self.private_folder)
-        else:
-            os.mkdir(self.private_folder)
 
     def __setup_database(self):
         self.database = Database(self.private_folder)
@@ -424,7 +424,7 @@ def run(args, verbose=False):
 
     defaults = {}
     actual_args = {}
-    for key, value in list(dict(vars(known_args)).items()):
+    for key, value in vars(known_args).items():
         if value != parser.get_default(key):
             actual_args[key] = value
         if parser.get_default(key) is not None:
@@ -31,47 +31,30 @@ from hotdoc.utils.configurable import Configurable
 from hotdoc.core.exceptions import ConfigError, ParsingException
 
 
+# Padding delays, eg. $<5>, in terminfo capabilities
+PADDING_REGEX = re.compile(r'\$<\d+>[/*]?')
+
+
 # pylint: disable=too-few-public-methods
 class TerminalController(object):
     """
     Banana banana
     """
-    # Cursor movement:
-    BOL = ''             # : Move the cursor to the beginning of the line
-    # pylint: disable=invalid-name
-    UP = ''              # : Move the cursor up one line
-    DOWN = ''            # : Move the cursor down one line
-    LEFT = ''            # : Move the cursor left one char
-    RIGHT = ''           # : Move the cursor right one char
-
-    # Deletion:
-    CLEAR_SCREEN = ''    # : Clear the screen and move to home position
-    CLEAR_EOL = ''       # : Clear to the end of the line.
-    CLEAR_BOL = ''       # : Clear to the beginning of the line.
-    CLEAR_EOS = ''       # : Clear to the end of the screen
-
-    # Output modes:
-    BOLD = ''            # : Turn on bold mode
-    BLINK = ''           # : Turn on blink mode
-    DIM = ''             # : Turn on half-bright mode
-    REVERSE = ''         # : Turn on reverse-video mode
-    NORMAL = ''          # : Turn off all modes
-
-    # Cursor display:
-    HIDE_CURSOR = ''     # : Make the cursor invisible
-    SHOW_CURSOR = ''     # : Make the cursor visible
+    # The capabilities are only looked up on first access, by __setup(),
+    # which sets them as instance attributes, defaulting to '':
+    #
+    # Cursor movement: BOL, UP, DOWN, LEFT, RIGHT
+    # Deletion: CLEAR_SCREEN, CLEAR_EOL, CLEAR_BOL, CLEAR_EOS
+    # Output modes: BOLD, BLINK, DIM, REVERSE, UNDERLINE, NORMAL
+    # Cursor display: HIDE_CURSOR, SHOW_CURSOR
+    # Foreground colors: BLACK, BLUE, GREEN, CYAN, RED, MAGENTA, YELLOW, WHITE
+    # Background colors: the same, prefixed with BG_
 
     # Terminal size:
+    # pylint: disable=invalid-name
     COLS = None          # : Width of the terminal (None for unknown)
     LINES = None         # : Height of the terminal (None for unknown)
 
-    # Foreground colors:
-    BLACK = BLUE = GREEN = CYAN = RED = MAGENTA = YELLOW = WHITE = ''
-
-    # Background colors:
-    BG_BLACK = BG_BLUE = BG_GREEN = BG_CYAN = ''
-    BG_RED = BG_MAGENTA = BG_YELLOW = BG_WHITE = ''
-
     _STRING_CAPABILITIES = """
     BOL=cr UP=cuu1 DOWN=cud1 LEFT=cub1 RIGHT=cuf1
     CLEAR_SCREEN=clear CLEAR_EOL=el CLEAR_BOL=el1 CLEAR_EOS=ed BOLD=bold
@@ -81,6 +64,35 @@ class TerminalController(object):
     _ANSICOLORS = "BLACK RED GREEN YELLOW BLUE MAGENTA CYAN WHITE".split()
 
     def __init__(self, term_stream=sys.stdout):
+        # Setting up the terminal means dozens of curses calls, only do
+        # it if some capability actually gets used. The stream and whether
+        # it is a tty are still captured now, so that redirecting
+        # sys.stdout later on does not change what gets detected.
+        self.__term_stream = term_stream
+        self.__isatty = term_stream.isatty()
+        self.__set_up = False
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set yet
+        if name.startswith('_') or self.__set_up:
+            raise AttributeError(name)
+
+        self.__set_up = True
+        self.__setup()
+
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # pylint: disable=too-many-branches
+    def __setup(self):
+        for capability in self._STRING_CAPABILITIES:
+            setattr(self, capability.split('=')[0], '')
+        for color in self._COLORS:
+            setattr(self, color, '')
+            setattr(self, 'BG_' + color, '')
+
         # Curses isn't available on all platforms
         try:
             import curses
@@ -88,13 +100,13 @@ class TerminalController(object):
             return
 
         # If the stream isn't a tty, then assume it has no capabilities.
-        if not term_stream.isatty():
+        if not self.__isatty:
             return
 
         # Check the terminal type.  If we fail, then assume that the
         # terminal has no capabilities.
         try:
-            curses.setupterm()
+            curses.setupterm(fd=self.__term_stream.fileno())
         # pylint: disable=bare-except
         except:
             return
@@ -136,7 +148,7 @@ class TerminalController(object):
     def _tigetstr(self, cap_name):
         import curses
         cap = curses.tigetstr(cap_name) or b''
-        return re.sub(r'\$<\d+>[/*]?', '', cap.decode()).encode()
+        return PADDING_REGEX.sub('', cap.decode()).encode()
 
 
 TERMC = TerminalController()
@@ -187,9 +199,9 @@ class Logger(Configurable):
 
     """Subclasses can inherit from this class to report recoverable errors."""
 
-    _error_code_to_exception = defaultdict()
+    _error_code_to_exception = {}
     _domain_codes = defaultdict(set)
-    _warning_code_to_exception = defaultdict()
+    _warning_code_to_exception = {}
     journal = []
     fatal_warnings = False
     raise_on_fatal_warnings = False
@@ -249,28 +261,28 @@ class Logger(Configurable):
         if code in Logger._ignored_codes:
             return
 
-        assert code in Logger._warning_code_to_exception
-        exc_type, domain = Logger._warning_code_to_exception[code]
+        registered = Logger._warning_code_to_exception.get(code)
+        assert registered is not None
+        exc_type, domain = registered
 
         if domain in Logger._ignored_domains:
             return
 
-        level = WARNING
-        if Logger.fatal_warnings:
-            level = ERROR
+        fatal = Logger.fatal_warnings
+        level = ERROR if fatal else WARNING
 
         exc = exc_type(message, **kwargs)
 
         Logger._log(code, exc.message, level, domain)
 
-        if Logger.fatal_warnings:
+        if fatal:
             if Logger.raise_on_fatal_warnings:
                 raise exc
             else:
                 Logger.n_fatal_warnings += 1
 
     @staticmethod
-    def debug(message, domain):
+    def debug(message, domain='core'):
         """Log debugging information"""
         if domain in Logger._ignored_domains:
             return
@@ -278,7 +290,7 @@ class Logger(Configurable):
         Logger._log(None, message, DEBUG, domain)
 
     @staticmethod
-    def info(message, domain):
+    def info(message, domain='core'):
         """Log simple info"""
         if domain in Logger._ignored_domains:
             return
@@ -308,11 +320,7 @@ class Logger(Configurable):
     @staticmethod
     def get_issues():
         """Get actual issues in the journal."""
-        issues = []
-        for entry in Logger.journal:
-            if entry.level >= WARNING:
-                issues.append(entry)
-        return issues
+        return [entry for entry in Logger.journal if entry.level >= WARNING]
 
     @staticmethod
     def reset():
@@ -361,9 +369,10 @@ class Logger(Configurable):
         Logger.enabled_warnings = set(config.get("enabled_warnings"))
 
 
-def info(message, domain='core'):
-    """Shortcut to `Logger.info`"""
-    Logger.info(message, domain)
+# These are called from everywhere, even when nothing gets printed: alias
+# them to the Logger methods rather than wrapping them, to save a call
+info = Logger.info
+debug = Logger.debug
 
 
 def warn(code, message, **kwargs):
@@ -371,11 +380,6 @@ def warn(code, message, **kwargs):
     Logger.warn(code, message, **kwargs)
 
 
-def debug(message, domain='core'):
-    """Shortcut to `Logger.debug`"""
-    Logger.debug(message, domain)
-
-
 def error(code, message, **kwargs):
     """Shortcut to `Logger.error`"""
     Logger.error(code, message, **kwargs)
@@ -66,14 +66,15 @@ class Signal(object):
 
     def __call__(self, *args, **kargs):
         res_list = []
-        # Call handler functions
-        for func in self._functions:
+        # Call handler functions. Iterate over copies, as handlers may
+        # connect or disconnect while the signal is being emitted
+        for func in list(self._functions):
             res = func(*args, **kargs)
             if res and self._optimized:
                 return res
             res_list.append(res)
 
-        for func in self._after_functions:
+        for func in list(self._after_functions):
             res = func(*args, **kargs)
             if res and self._optimized:
                 return res
@@ -160,3 +161,35 @@ class TestSignals(unittest.TestCase):
 
         signal(1)
         self.assertEqual(called, [True])
+
+    def test_disconnect_during_emission(self):
+        """Banana Banana"""
+        called = []
+        signal = Signal()
+
+        def first():
+            """Banana Banana"""
+            called.append('first')
+            signal.disconnect(first)
+            signal.disconnect(second)
+
+        def second():
+            """Banana Banana"""
+            called.append('second')
+
+        def after():
+            """Banana Banana"""
+            called.append('after')
+            signal.disconnect(after)
+
+        signal.connect(first)
+        signal.connect(second)
+        signal.connect_after(after)
+
+        # Handlers disconnected during an emission are only skipped from
+        # the next one on
+        signal()
+        self.assertEqual(called, ['first', 'second', 'after'])
+
+        signal()
+        self.assertEqual(called, ['first', 'second', 'after'])
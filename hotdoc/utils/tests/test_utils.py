@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2015,2016 Mathieu Duponchelle <mathieu.duponchelle@opencreed.com>
+# Copyright © 2015,2016 Collabora Ltd
+#
+# This library is free software; you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation; either version 2.1 of the License, or (at your option)
+# any later version.
+#
+# This library is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+# pylint: disable=missing-docstring
+# pylint: disable=invalid-name
+
+import os
+import pickle
+import shutil
+import stat
+import tempfile
+import unittest
+
+from hotdoc.utils.utils import (
+    OrderedSet, nested_defaultdict, write_atomically, copy_if_changed)
+
+
+class TestOrderedSet(unittest.TestCase):
+    def test_order(self):
+        oset = OrderedSet(['c', 'a', 'b', 'a'])
+        oset.add('d')
+        oset |= ['a', 'e']
+        self.assertListEqual(list(oset), ['c', 'a', 'b', 'd', 'e'])
+        self.assertListEqual(list(reversed(oset)), ['e', 'd', 'b', 'a', 'c'])
+
+    def test_pop_discard(self):
+        oset = OrderedSet(['a', 'b', 'c', 'd'])
+        self.assertEqual(oset.pop(), 'd')
+        self.assertEqual(oset.pop(last=False), 'a')
+        oset.discard('b')
+        oset.discard('not-there')
+        self.assertEqual(oset, OrderedSet(['c']))
+        oset.pop()
+        with self.assertRaises(KeyError):
+            oset.pop()
+
+    def test_pickle(self):
+        for oset in (OrderedSet(), OrderedSet(['b', 'a'])):
+            self.assertEqual(pickle.loads(pickle.dumps(oset)), oset)
+
+
+class TestNestedDefaultdict(unittest.TestCase):
+    def test_pickle(self):
+        attrs = nested_defaultdict()
+        attrs['html']['scripts']['foo'] = 'bar'
+        loaded = pickle.loads(pickle.dumps(attrs))
+        self.assertEqual(loaded['html']['scripts'], {'foo': 'bar'})
+        self.assertEqual(loaded['other']['key'], {})
+
+
+class TestWriteAtomically(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_keep_mode(self):
+        path = os.path.join(self.tmp_dir, 'foo.txt')
+        write_atomically(path, 'foo')
+        os.chmod(path, 0o640)
+        write_atomically(path, 'bar')
+        with open(path) as _:
+            self.assertEqual(_.read(), 'bar')
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+        self.assertEqual(os.listdir(self.tmp_dir), ['foo.txt'])
+
+    def test_new_file_mode(self):
+        path = os.path.join(self.tmp_dir, 'foo.txt')
+        umask = os.umask(0o027)
+        try:
+            write_atomically(path, 'foo')
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+
+
+class TestCopyIfChanged(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp_dir, 'src.sh')
+        self.dest = os.path.join(self.tmp_dir, 'dest.sh')
+        with open(self.src, 'w') as _:
+            _.write('#!/bin/sh\n')
+        os.chmod(self.src, 0o750)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_copy_mode(self):
+        copy_if_changed(self.src, self.dest)
+        self.assertEqual(stat.S_IMODE(os.stat(self.dest).st_mode), 0o750)
+
+    def test_unchanged(self):
+        copy_if_changed(self.src, self.dest)
+        mtime = os.stat(self.dest).st_mtime_ns - 10 ** 9
+        os.utime(self.dest, ns=(mtime, mtime))
+        copy_if_changed(self.src, self.dest)
+        self.assertEqual(os.stat(self.dest).st_mtime_ns, mtime)
@@ -20,10 +20,12 @@
 Toolbox
 """
 
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable, MutableSet
 import os
 import shutil
+import stat
+import filecmp
 import math
 import sys
 import re
@@ -32,7 +34,6 @@ import itertools
 import traceback
 import importlib.util
 
-from urllib.request import urlretrieve
 from pathlib import Path
 
 from backports.entry_points_selectable import entry_points
@@ -66,6 +67,9 @@ XDG_DATA_DIRS = os.getenv(
 XDG_DATA_HOME = os.getenv(
     'XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
 
+ID_STRIP_REGEX = re.compile(r"[^\w\s]")
+ID_SPACES_REGEX = re.compile(r"\s+")
+
 
 def splitall(path):
     """
@@ -81,30 +85,142 @@ def splitall(path):
     return components
 
 
+def copy_if_changed(src, dest):
+    """
+    Copies `src` to `dest` along with its permission bits, unless `dest`
+    already exists with the same size and contents, in which case it is
+    left untouched so that its mtime is preserved for incremental
+    consumers of the output.
+    """
+    try:
+        if filecmp.cmp(src, dest, shallow=False):
+            return
+    except FileNotFoundError:
+        pass
+
+    shutil.copy(src, dest)
+
+
+# O_EXCL so that concurrent writers never share a temporary file
+_TMP_FILE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_EXCL |
+                   getattr(os, 'O_BINARY', 0))
+
+
+def _open_tmp_file(path):
+    dirname, basename = os.path.split(path)
+    while True:
+        tmp_path = os.path.join(dirname, '.%s.%s.tmp' % (
+            basename, os.urandom(6).hex()))
+        try:
+            # The kernel applies the umask to new files
+            return os.open(tmp_path, _TMP_FILE_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _write_bytes_atomically(path, data):
+    # Write through symlinks instead of replacing them with a regular file
+    path = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, tmp_path = _open_tmp_file(path)
+    try:
+        with os.fdopen(fd, 'wb') as _:
+            _.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_atomically(path, contents):
+    """
+    Writes `contents` to a temporary file next to `path` then renames it
+    over `path`, so that readers never see a partially written file.
+
+    If `path` is a symlink, its target is written instead, and the mode
+    of an existing file is preserved.
+    """
+    _write_bytes_atomically(path, contents.encode('utf-8'))
+
+
+def write_if_changed(path, contents):
+    """
+    Writes `contents` to `path` atomically, unless `path` already holds
+    exactly these contents, in which case it is left untouched so that its
+    mtime is preserved.
+
+    Returns:
+        bool: whether `path` was written to.
+    """
+    # Encode once, and compare bytes: the existing file only needs to be
+    # read when its size matches, and never needs to be decoded
+    data = contents.encode('utf-8')
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as _:
+                if _.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+
+    _write_bytes_atomically(path, data)
+    return True
+
+
+def _overwrite_link(src, dest):
+    linkto = os.readlink(src)
+    try:
+        os.remove(dest)
+    except FileNotFoundError:
+        pass
+    symlink(linkto, dest)
+
+
+def _overwrite_tree(src, dest, ignore):
+    os.makedirs(dest, exist_ok=True)
+
+    # The entries yielded by scandir carry their file type, which spares
+    # us an islink and an isdir stat call for each file we copy
+    with os.scandir(src) as entries:
+        entries = list(entries)
+
+    if ignore is not None:
+        ignored = ignore(src, [entry.name for entry in entries])
+    else:
+        ignored = set()
+
+    for entry in entries:
+        if entry.name in ignored:
+            continue
+
+        entry_dest = os.path.join(dest, entry.name)
+        if entry.is_symlink():
+            _overwrite_link(entry.path, entry_dest)
+        elif entry.is_dir():
+            _overwrite_tree(entry.path, entry_dest, ignore)
+        else:
+            copy_if_changed(entry.path, entry_dest)
+
+
 def recursive_overwrite(src, dest, ignore=None):
     """
     Banana banana
     """
     if os.path.islink(src):
-        linkto = os.readlink(src)
-        if os.path.exists(dest):
-            os.remove(dest)
-        symlink(linkto, dest)
+        _overwrite_link(src, dest)
     elif os.path.isdir(src):
-        if not os.path.isdir(dest):
-            os.makedirs(dest)
-        files = os.listdir(src)
-        if ignore is not None:
-            ignored = ignore(src, files)
-        else:
-            ignored = set()
-        for _ in files:
-            if _ not in ignored:
-                recursive_overwrite(os.path.join(src, _),
-                                    os.path.join(dest, _),
-                                    ignore)
+        _overwrite_tree(src, dest, ignore)
     else:
-        shutil.copyfile(src, dest)
+        copy_if_changed(src, dest)
 
 
 def count_folders(path):
@@ -120,8 +236,11 @@ def all_subclasses(cls):
     """
     Banana banana
     """
-    return cls.__subclasses__() + [g for s in cls.__subclasses__()
-                                   for g in all_subclasses(s)]
+    subclasses = cls.__subclasses__()
+    res = list(subclasses)
+    for subclass in subclasses:
+        res.extend(all_subclasses(subclass))
+    return res
 
 
 def flatten_list(list_):
@@ -139,12 +258,29 @@ def flatten_list(list_):
     return res
 
 
+def _dict_defaultdict():
+    return defaultdict(dict)
+
+
+def nested_defaultdict():
+    """
+    Returns a two-level defaultdict of dicts, as used for per-extension
+    attributes.
+
+    The inner factory is a module-level function rather than a lambda,
+    so the result can be pickled and no closure is created per call.
+    """
+    return defaultdict(_dict_defaultdict)
+
+
 def get_mtime(filename):
     """
-    Banana banana
+    Returns the modification time of `filename` as an integer number of
+    nanoseconds, or -1 if it does not exist. Integers compare exactly,
+    unlike the float returned by `os.path.getmtime`.
     """
     try:
-        return os.path.getmtime(filename)
+        return os.stat(filename).st_mtime_ns
     except FileNotFoundError:
         return -1
 
@@ -277,9 +413,10 @@ class OrderedSet(MutableSet):
     """
 
     def __init__(self, iterable=None):
-        self.end = end = []
-        end += [None, end, end]         # sentinel node for doubly linked list
-        self.map = {}                   # key --> [key, prev, next]
+        # Keys of a C-level OrderedDict, instead of a linked list of
+        # python lists: no per-element list allocation, and iteration and
+        # membership tests do not go through the interpreter
+        self.map = OrderedDict()
         if iterable is not None:
             self |= iterable
 
@@ -294,10 +431,11 @@ class OrderedSet(MutableSet):
         """
         Banana banana
         """
-        if key not in self.map:
-            end = self.end
-            curr = end[1]
-            curr[2] = end[1] = self.map[key] = [key, curr, end]
+        self.map.setdefault(key)
+
+    def __ior__(self, iterable):
+        self.map.update(dict.fromkeys(iterable))
+        return self
 
     def __getstate__(self):
         if not self:
@@ -322,24 +460,13 @@ class OrderedSet(MutableSet):
         """
         Banana banana
         """
-        if key in self.map:
-            key, prev, nxt = self.map.pop(key)
-            prev[2] = nxt
-            nxt[1] = prev
+        self.map.pop(key, None)
 
     def __iter__(self):
-        end = self.end
-        curr = end[2]
-        while curr is not end:
-            yield curr[0]
-            curr = curr[2]
+        return iter(self.map)
 
     def __reversed__(self):
-        end = self.end
-        curr = end[1]
-        while curr is not end:
-            yield curr[0]
-            curr = curr[1]
+        return reversed(self.map)
 
     # pylint: disable=arguments-differ
     def pop(self, last=True):
@@ -348,9 +475,7 @@ class OrderedSet(MutableSet):
         """
         if not self:
             raise KeyError('set is empty')
-        key = self.end[1][0] if last else self.end[2][0]
-        self.discard(key)
-        return key
+        return self.map.popitem(last)[0]
 
     def __repr__(self):
         if not self:
@@ -421,8 +546,8 @@ def id_from_text(text, add_hash=False):
     # No unicode in urls
     id_ = id_.encode('ascii', errors='ignore').decode()
 
-    id_ = re.sub(r"[^\w\s]", '', id_)
-    id_ = re.sub(r"\s+", '-', id_)
+    id_ = ID_STRIP_REGEX.sub('', id_)
+    id_ = ID_SPACES_REGEX.sub('-', id_)
     if add_hash:
         return '#%s' % id_
     return id_
@@ -432,6 +557,8 @@ def get_cat(path):
     """
     Banana banana
     """
+    # pylint: disable=import-outside-toplevel
+    from urllib.request import urlretrieve
     filename, _ = urlretrieve(
         'http://thecatapi.com/api/images/get?format=src&type=gif',
         filename=path)